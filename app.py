@@ -12,14 +12,15 @@ This dashboard showcases Python's capabilities for:
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
 import pandas as pd
 import numpy as np
+import uuid
 
 # Import our custom components
 from components.data_generator import generate_energy_data, generate_appliance_data
-from components.charts import create_consumption_chart, create_appliance_breakdown, create_cost_analysis
-from components.tips import get_energy_tips, display_tip_card
+from components.charts import create_consumption_chart, create_appliance_breakdown, create_cost_analysis, clear_figure_caches, DARK_LAYOUT
+from components.tips import get_energy_tips, display_tip_cards
 
 # Configure the Streamlit page
 st.set_page_config(
@@ -29,10 +30,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Load custom CSS
-def load_css():
-    """Load custom CSS for dark minimalistic styling"""
-    st.markdown("""
+# Custom CSS for dark minimalistic styling
+# Defined once at import time instead of being rebuilt inside load_css()
+DARK_THEME_CSS = """
     <style>
     /* Dark theme base - glossy black background */
     .stApp {
@@ -224,6 +224,66 @@ def load_css():
         color: #e0e0e0;
     }
     
+    /* Energy tip cards - three-column grid */
+    .tip-grid {
+        display: grid;
+        grid-template-columns: repeat(3, 1fr);
+        gap: 1rem;
+    }
+    
+    /* Stack the tip cards on narrow screens, as st.columns did */
+    @media (max-width: 640px) {
+        .tip-grid {
+            grid-template-columns: 1fr;
+        }
+    }
+    
+    /* Energy tip cards - --tip-color is set per card from its difficulty */
+    .tip-card {
+        background: linear-gradient(135deg, rgba(30, 30, 30, 0.8) 0%, rgba(40, 40, 40, 0.6) 100%);
+        border: 1px solid #333;
+        border-left: 4px solid var(--tip-color);
+        padding: 1.5rem;
+        border-radius: 10px;
+        margin-bottom: 1rem;
+        backdrop-filter: blur(10px);
+        box-shadow: 0 4px 16px rgba(0, 0, 0, 0.2);
+    }
+    
+    .tip-card h4 {
+        color: #f0f0f0;
+        margin-bottom: 0.8rem;
+        font-weight: 400;
+    }
+    
+    .tip-card p {
+        margin-bottom: 1rem;
+        color: #d0d0d0;
+        line-height: 1.5;
+    }
+    
+    .tip-card-footer {
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+        margin-top: 1rem;
+    }
+    
+    .tip-badge {
+        background: var(--tip-color);
+        color: white;
+        padding: 0.3rem 0.8rem;
+        border-radius: 15px;
+        font-size: 0.85rem;
+        font-weight: 500;
+    }
+    
+    .tip-savings {
+        font-weight: 600;
+        color: var(--tip-color);
+        font-size: 1rem;
+    }
+    
     /* Text colors */
     h1, h2, h3, h4, h5, h6 {
         color: #f0f0f0 !important;
@@ -265,7 +325,270 @@ def load_css():
         display: none !important;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+# Load custom CSS
+def load_css():
+    """Load custom CSS for dark minimalistic styling"""
+    # Streamlit removes elements that are not re-emitted on a rerun, so the
+    # style block is still sent every run; it is just no longer rebuilt.
+    st.markdown(DARK_THEME_CSS, unsafe_allow_html=True)
+
+# Sidebar options, defined once at import time
+# Time periods pair the display label with the number of days it covers
+TIME_PERIODS = (
+    ("Last 7 Days", 7),
+    ("Last 30 Days", 30),
+    ("Last 3 Months", 90),
+    ("Last Year", 365)
+)
+PERIOD_LABELS = tuple(label for label, _ in TIME_PERIODS)
+PERIOD_DAYS = dict(TIME_PERIODS)
+HOUSE_TYPES = ("Small Apartment", "Medium House", "Large House", "Mansion")
+ENERGY_SOURCES = ("Grid Electricity", "Solar + Grid", "Solar Only", "Wind + Grid")
+
+# Sample data for investment vs savings analysis
+# This demonstrates creating structured data for analysis
+SAVINGS_DATA = pd.DataFrame({
+    'Strategy': ['LED Upgrades', 'Smart Thermostat', 'Energy Star Appliances', 'Solar Panels'],
+    'Monthly Savings': [15, 25, 30, 85],
+    'Investment': [200, 300, 1500, 15000]
+})
+
+# Day names indexed by pandas' dayofweek (0 = Monday)
+WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# Cached data loaders
+@st.cache_resource
+def data_version():
+    """
+    Token shared by every session that identifies the current generated data.
+    
+    Refresh Data clears st.cache_resource, so the next call creates a new
+    token; sessions compare it against their cached view and rebuild it.
+    """
+    return uuid.uuid4().hex
+
+# Streamlit reruns the whole script on every widget interaction, so the
+# generated data is cached per (days, house_type, today). The cache is
+# persisted to disk so it survives app restarts (persisted caches ignore
+# TTLs, so the number of entries is capped instead); `today` is part of the
+# key so date-based data rolls over at midnight instead of staying frozen.
+# The "Refresh Data" button clears these caches via st.cache_data.clear().
+@st.cache_data(persist="disk", max_entries=16)
+def load_energy_data(days, house_type, today):
+    """
+    Generate (or fetch from cache) daily energy data for the selected profile.
+    
+    `today` is unused by the body; it only keys the cache, because the data
+    always ends at the current date.
+    """
+    return generate_energy_data(days=days, house_type=house_type)
+
+@st.cache_data(persist="disk", max_entries=16)
+def load_appliance_data(house_type):
+    """Generate (or fetch from cache) appliance data for the selected profile"""
+    return generate_appliance_data(house_type=house_type)
+
+@st.cache_data(persist="disk", max_entries=16)
+def compute_kpis(days, house_type, today):
+    """
+    Compute all dashboard KPIs for a profile in one place.
+    
+    The consumption column is pulled out as a NumPy array once and every
+    statistic is reduced from that array, so reruns with unchanged inputs
+    skip the work entirely and cache misses avoid repeated pandas passes.
+    
+    Args:
+        days (int): Number of days of data
+        house_type (str): Type of house
+        today (datetime.date): Current date (cache key only)
+    
+    Returns:
+        dict: KPI values used by the metrics and insights sections
+    """
+    # Derived values are kept in local arrays; nothing is written back to
+    # the cached DataFrame
+    energy_data = load_energy_data(days, house_type, today)
+    cons = energy_data['consumption'].to_numpy()
+    peak_idx = int(cons.argmax())
+    
+    # One sum is shared by the average, the total cost and the trend: the
+    # trend compares the last 7 days against everything before them
+    n = len(cons)
+    total = float(cons.sum())
+    recent = float(cons[-7:].sum())
+    n_recent = min(7, n)
+    trend_up = recent / n_recent > (total - recent) / max(1, n - n_recent)
+    
+    # Weekly pattern analysis
+    # Average per day of week via integer bincount (0 = Monday ... 6 = Sunday);
+    # names are only looked up for the final result
+    dow = energy_data['date'].dt.dayofweek.to_numpy(dtype=np.int8)
+    weekly_sum = np.bincount(dow, weights=cons, minlength=7)
+    weekly_cnt = np.bincount(dow, minlength=7)
+    weekly_avg = weekly_sum / np.maximum(weekly_cnt, 1)
+    
+    peak_day = energy_data['date'].iloc[peak_idx]
+    peak_usage = float(cons[peak_idx])
+    highest_day = WEEKDAY_NAMES[int(weekly_avg.argmax())]
+    weekend_higher = bool(weekly_avg[5:].mean() > weekly_avg[:5].mean())
+    
+    return {
+        'current_usage': float(cons[-1]),
+        'avg_usage': total / n,
+        'total_cost': total * 0.12,
+        'peak_day': peak_day,
+        'peak_usage': peak_usage,
+        'trend_up': bool(trend_up),
+        'highest_day': highest_day,
+        'weekend_higher': weekend_higher,
+        # Insight texts are formatted here so reruns only display them
+        'info_md': (
+            f"**Peak Usage:** {peak_day:%B %d}\n\n"
+            f"**Peak Consumption:** {peak_usage:.1f} kWh\n\n"
+            f"**Trend:** {'Increasing' if trend_up else 'Decreasing'}"
+        ),
+        'success_md': (
+            f"**Highest Day:** {highest_day}\n\n"
+            f"**Pattern:** {'Weekend higher' if weekend_higher else 'Weekday higher'}"
+        )
+    }
+
+# Cached figure builders
+# Plotly figures are mutable objects, so they are cached with
+# st.cache_resource and shared across reruns for the same inputs.
+# Dark theme styling comes from DARK_LAYOUT in components.charts
+@st.cache_resource(ttl=3600)
+def consumption_figure(days, house_type, time_period, today):
+    """Build the consumption trend chart for a profile"""
+    return create_consumption_chart(load_energy_data(days, house_type, today), time_period)
+
+@st.cache_resource(ttl=3600)
+def appliance_breakdown_figure(house_type):
+    """Build the appliance pie chart for a profile"""
+    return create_appliance_breakdown(load_appliance_data(house_type))
+
+@st.cache_resource(ttl=3600)
+def appliance_bar_figure(house_type):
+    """Build the horizontal appliance bar chart for a profile"""
+    appliance_data = load_appliance_data(house_type)
+    
+    # Horizontal bar chart for detailed view
+    # The data arrives sorted largest first; reversing it puts the largest
+    # bar at the top without re-sorting
+    fig_bar = px.bar(
+        appliance_data.iloc[::-1],
+        x='daily_kwh',
+        y='appliance',
+        orientation='h',
+        title="Daily Consumption by Appliance",
+        color='daily_kwh',
+        color_continuous_scale=[[0, '#666666'], [0.5, '#b0b0b0'], [1, '#e0e0e0']]  # Minimal grey scale
+    )
+    fig_bar.update_layout(**DARK_LAYOUT, height=400, showlegend=False)
+    return fig_bar
+
+@st.cache_resource(ttl=3600)
+def cost_analysis_figure(days, house_type, today):
+    """Build the daily/cumulative cost chart for a profile"""
+    return create_cost_analysis(load_energy_data(days, house_type, today))
+
+@st.cache_resource(ttl=3600)
+def cost_breakdown_figure(days, house_type, today):
+    """Build the daily/monthly/yearly cost comparison chart for a profile"""
+    total_cost = compute_kpis(days, house_type, today)['total_cost']
+    
+    # Calculate costs for different time periods
+    # This demonstrates mathematical calculations and data scaling
+    monthly_cost = total_cost * 30 / days
+    yearly_cost = monthly_cost * 12
+    
+    # Create cost comparison data
+    cost_data = pd.DataFrame({
+        'Period': ['Daily', 'Monthly', 'Yearly'],
+        'Cost': [total_cost/days, monthly_cost, yearly_cost]
+    })
+    
+    # Bar chart for cost comparison
+    fig_cost_bar = px.bar(
+        cost_data,
+        x='Period',
+        y='Cost',
+        title="Average Energy Costs",
+        color='Cost',
+        color_continuous_scale=[[0, '#b0b0b0'], [0.5, '#f44336'], [1, '#f44336']]  # Grey to red for costs
+    )
+    fig_cost_bar.update_layout(**DARK_LAYOUT)
+    return fig_cost_bar
+
+@st.cache_resource
+def savings_figure():
+    """Build the investment vs savings scatter chart"""
+    # Scatter plot to show investment vs return relationship
+    fig_savings = px.scatter(
+        SAVINGS_DATA,
+        x='Investment',
+        y='Monthly Savings',
+        size='Monthly Savings',
+        color='Strategy',
+        title="Investment vs Monthly Savings",
+        hover_data=['Strategy']
+    )
+    fig_savings.update_layout(**DARK_LAYOUT)
+    return fig_savings
+
+# Tab content
+# Each tab is a fragment so interactions inside it only rerun that tab
+@st.fragment
+def render_consumption_tab(days, house_type, time_period, today, kpis):
+    """Render the consumption trend chart and insights"""
+    # Two-column layout for chart and insights
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # Display the interactive chart
+        # This demonstrates plotly integration with Streamlit
+        st.plotly_chart(consumption_figure(days, house_type, time_period, today), use_container_width=True)
+    
+    with col2:
+        st.markdown("### Insights")
+        
+        # Peak usage and trend come from the precomputed KPIs
+        st.info(kpis['info_md'])
+        
+        # Weekly pattern analysis
+        st.success(kpis['success_md'])
+
+@st.fragment
+def render_breakdown_tab(house_type):
+    """Render the appliance breakdown charts"""
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        # Pie chart for appliance consumption distribution
+        st.plotly_chart(appliance_breakdown_figure(house_type), use_container_width=True)
+    
+    with col2:
+        # Horizontal bar chart for detailed view
+        st.plotly_chart(appliance_bar_figure(house_type), use_container_width=True)
+
+@st.fragment
+def render_cost_tab(days, house_type, today):
+    """Render the cost analysis charts"""
+    # Main cost analysis chart
+    st.plotly_chart(cost_analysis_figure(days, house_type, today), use_container_width=True)
+    
+    # Cost breakdown section
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### Cost Breakdown")
+        st.plotly_chart(cost_breakdown_figure(days, house_type, today), use_container_width=True)
+    
+    with col2:
+        st.markdown("### Savings Opportunities")
+        st.plotly_chart(savings_figure(), use_container_width=True)
 
 def main():
     """
@@ -302,45 +625,57 @@ def main():
         st.markdown("### Time Period")
         time_period = st.selectbox(
             "Select period:",
-            ["Last 7 Days", "Last 30 Days", "Last 3 Months", "Last Year"]
+            PERIOD_LABELS
         )
         
         st.markdown("### House Profile")
         house_type = st.selectbox(
             "House type:",
-            ["Small Apartment", "Medium House", "Large House", "Mansion"]
+            HOUSE_TYPES
         )
         
         energy_source = st.selectbox(
             "Primary source:",
-            ["Grid Electricity", "Solar + Grid", "Solar Only", "Wind + Grid"]
+            ENERGY_SOURCES
         )
         
         # Button to refresh data - demonstrates state management
         if st.button("Refresh Data", type="primary"):
             st.cache_data.clear()  # Clear Streamlit's cache
+            st.cache_resource.clear()  # Drop figures built from the old data
+            clear_figure_caches()  # ...including the chart module's own LRU caches
+            st.session_state.pop("_cache", None)  # Drop the cached view
             st.rerun()  # Reload the app with new data
     
     # === DATA GENERATION ===
     # Convert user selections into data parameters
     # This demonstrates dictionary lookups and data processing
-    days = {"Last 7 Days": 7, "Last 30 Days": 30, "Last 3 Months": 90, "Last Year": 365}[time_period]
-    
-    # Generate sample data based on user selections
-    # These functions demonstrate data simulation and pandas usage
-    energy_data = generate_energy_data(days=days, house_type=house_type)
-    appliance_data = generate_appliance_data(house_type=house_type)
+    days = PERIOD_DAYS[time_period]
+    today = date.today()  # Part of every date-based cache key
     
     # === KEY METRICS SECTION ===
     # Create a responsive layout with columns
     # This demonstrates Streamlit's layout system
     col1, col2, col3, col4 = st.columns(4)
     
-    # Calculate key performance indicators (KPIs)
-    # This shows basic statistical calculations and business logic
-    current_usage = energy_data['consumption'].iloc[-1]  # Latest value
-    avg_usage = energy_data['consumption'].mean()        # Average calculation
-    total_cost = (energy_data['consumption'] * 0.12).sum()  # Cost calculation
+    # Key performance indicators (KPIs) and tips are computed once per set of
+    # inputs and kept in session state, so reruns caused by unrelated widgets
+    # skip straight to rendering. The data version makes every session drop
+    # its view when any session refreshes the data.
+    view_key = (days, house_type, energy_source, today, data_version())
+    view = st.session_state.get("_cache")
+    if view is None or view['key'] != view_key:
+        kpis = compute_kpis(days, house_type, today)
+        # Personalized tips based on usage patterns
+        # This demonstrates conditional logic and data-driven recommendations
+        tips = get_energy_tips(house_type, energy_source, kpis['current_usage'], kpis['avg_usage'])
+        view = {'key': view_key, 'kpis': kpis, 'tips': tips}
+        st.session_state["_cache"] = view
+    
+    kpis = view['kpis']
+    current_usage = kpis['current_usage']  # Latest value
+    avg_usage = kpis['avg_usage']          # Average calculation
+    total_cost = kpis['total_cost']        # Cost calculation
     savings_potential = total_cost * 0.15  # 15% potential savings estimate
     
     # Display metrics using Streamlit's metric widget
@@ -384,163 +719,29 @@ def main():
     
     # Tab 1: Consumption Trends
     with tab1:
-        # Two-column layout for chart and insights
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            # Generate and display interactive chart
-            # This demonstrates plotly integration with Streamlit
-            fig = create_consumption_chart(energy_data, time_period)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            st.markdown("### Insights")
-            
-            # Data analysis to find peak usage patterns
-            # This shows pandas data manipulation and analysis
-            peak_day = energy_data.loc[energy_data['consumption'].idxmax(), 'date']
-            peak_usage = energy_data['consumption'].max()
-            
-            # Display insights using info boxes
-            st.info(f"""
-            **Peak Usage:** {peak_day.strftime('%B %d')}
-            
-            **Peak Consumption:** {peak_usage:.1f} kWh
-            
-            **Trend:** {'Increasing' if energy_data['consumption'].iloc[-7:].mean() > energy_data['consumption'].iloc[:-7].mean() else 'Decreasing'}
-            """)
-            
-            # Weekly pattern analysis
-            # This demonstrates groupby operations and statistical analysis
-            energy_data['weekday'] = energy_data['date'].dt.day_name()
-            weekly_avg = energy_data.groupby('weekday')['consumption'].mean()
-            highest_day = weekly_avg.idxmax()
-            
-            st.success(f"""
-            **Highest Day:** {highest_day}
-            
-            **Pattern:** {'Weekend higher' if weekly_avg[['Saturday', 'Sunday']].mean() > weekly_avg[['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']].mean() else 'Weekday higher'}
-            """)
+        render_consumption_tab(days, house_type, time_period, today, kpis)
     
     # Tab 2: Appliance Breakdown
     with tab2:
-        col1, col2 = st.columns([1, 1])
-        
-        with col1:
-            # Pie chart for appliance consumption distribution
-            fig_pie = create_appliance_breakdown(appliance_data)
-            st.plotly_chart(fig_pie, use_container_width=True)
-        
-        with col2:
-            # Horizontal bar chart for detailed view
-            # This demonstrates different chart types and data sorting
-            fig_bar = px.bar(
-                appliance_data.sort_values('daily_kwh', ascending=True),
-                x='daily_kwh',
-                y='appliance',
-                orientation='h',
-                title="Daily Consumption by Appliance",
-                color='daily_kwh',
-                color_continuous_scale=[[0, '#666666'], [0.5, '#b0b0b0'], [1, '#e0e0e0']]  # Minimal grey scale
-            )
-            fig_bar.update_layout(
-                height=400,
-                showlegend=False,
-                plot_bgcolor='rgba(0,0,0,0)',  # Transparent background
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#e0e0e0'),  # Light text for dark theme
-                title_font=dict(color='#f0f0f0')
-            )
-            st.plotly_chart(fig_bar, use_container_width=True)
+        render_breakdown_tab(house_type)
     
     # Tab 3: Cost Analysis
     with tab3:
-        # Main cost analysis chart
-        fig_cost = create_cost_analysis(energy_data)
-        st.plotly_chart(fig_cost, use_container_width=True)
-        
-        # Cost breakdown section
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### Cost Breakdown")
-            
-            # Calculate costs for different time periods
-            # This demonstrates mathematical calculations and data scaling
-            monthly_cost = total_cost * 30 / days
-            yearly_cost = monthly_cost * 12
-            
-            # Create cost comparison data
-            cost_data = pd.DataFrame({
-                'Period': ['Daily', 'Monthly', 'Yearly'],
-                'Cost': [total_cost/days, monthly_cost, yearly_cost]
-            })
-            
-            # Bar chart for cost comparison
-            fig_cost_bar = px.bar(
-                cost_data,
-                x='Period',
-                y='Cost',
-                title="Average Energy Costs",
-                color='Cost',
-                color_continuous_scale=[[0, '#b0b0b0'], [0.5, '#f44336'], [1, '#f44336']]  # Grey to red for costs
-            )
-            fig_cost_bar.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#e0e0e0'),
-                title_font=dict(color='#f0f0f0')
-            )
-            st.plotly_chart(fig_cost_bar, use_container_width=True)
-        
-        with col2:
-            st.markdown("### Savings Opportunities")
-            
-            # Sample data for investment vs savings analysis
-            # This demonstrates creating structured data for analysis
-            savings_data = pd.DataFrame({
-                'Strategy': ['LED Upgrades', 'Smart Thermostat', 'Energy Star Appliances', 'Solar Panels'],
-                'Monthly Savings': [15, 25, 30, 85],
-                'Investment': [200, 300, 1500, 15000]
-            })
-            
-            # Scatter plot to show investment vs return relationship
-            fig_savings = px.scatter(
-                savings_data,
-                x='Investment',
-                y='Monthly Savings',
-                size='Monthly Savings',
-                color='Strategy',
-                title="Investment vs Monthly Savings",
-                hover_data=['Strategy']
-            )
-            fig_savings.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#e0e0e0'),
-                title_font=dict(color='#f0f0f0')
-            )
-            st.plotly_chart(fig_savings, use_container_width=True)
+        render_cost_tab(days, house_type, today)
     
     # === ENERGY TIPS SECTION ===
     # Personalized recommendations based on user data
     st.markdown("## Energy Tips")
     
-    # Generate personalized tips based on usage patterns
-    # This demonstrates conditional logic and data-driven recommendations
-    tips = get_energy_tips(house_type, energy_source, current_usage, avg_usage)
+    tips = view['tips']
     
-    # Display top tips in a grid layout
-    cols = st.columns(3)
-    for i, tip in enumerate(tips[:3]):
-        with cols[i % 3]:
-            display_tip_card(tip)
+    # Display top tips in a three-column CSS grid with a single markdown call
+    display_tip_cards(tips[:3], css_class="tip-grid")
     
     # Additional tips in expandable section
     # This demonstrates progressive disclosure UI pattern
     with st.expander("More Tips"):
-        for tip in tips[3:]:
-            display_tip_card(tip)
+        display_tip_cards(tips[3:])
     
     # === FOOTER ===
     # Minimal separator only - no branding or technology mentions
@@ -9,12 +9,19 @@ This module demonstrates:
 - Different chart types (line, bar, pie, scatter)
 """
 
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 
+from components.data_generator import EFFICIENCY_RATINGS
+
 # Minimalistic color schemes for dark theme - only black/grey/white with green/red accents
 COLORS = {
     'primary': '#e0e0e0',      # Light grey for primary text
@@ -27,7 +34,7 @@ COLORS = {
 }
 
 # Minimalistic chart colors - shades of grey with green/red for important data
-PLOTLY_COLORS = [
+PLOTLY_COLORS = (
     '#e0e0e0',  # Light grey - primary data
     '#b0b0b0',  # Medium grey - secondary data
     '#888888',  # Dark grey - tertiary data
@@ -35,8 +42,146 @@ PLOTLY_COLORS = [
     '#f44336',  # Red - negative/bad values only
     '#cccccc',  # Very light grey
     '#666666'   # Darker grey
-]
+)
+
+# Numeric score for each rating in data_generator.EFFICIENCY_RATINGS (best
+# first), aligned by index
+EFFICIENCY_SCORES = np.array([10, 9, 8, 7, 6, 5, 4], dtype=np.int8)
+
+# Dark theme styling shared by every chart, built once at import and applied
+# to each figure's own layout; template-level styling would be overwritten
+# by st.plotly_chart's Streamlit theme
+DARK_LAYOUT = dict(
+    plot_bgcolor='rgba(0,0,0,0)',    # Transparent plot background
+    paper_bgcolor='rgba(0,0,0,0)',   # Transparent paper background
+    font=dict(family="Arial", size=12, color='#e0e0e0'),  # Light text for dark theme
+    title_font=dict(size=16, color='#f0f0f0')             # Title font
+)
+
+def fingerprint_dataframe(df):
+    """Return a short content hash of a DataFrame (values, index, column names and dtypes)"""
+    row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16)
+    # hash_pandas_object only covers values, so the schema is hashed separately
+    schema = (
+        tuple(map(str, df.columns)),
+        tuple(map(str, df.dtypes)),
+        tuple(map(str, df.index.names))
+    )
+    digest.update(repr(schema).encode())
+    return digest.hexdigest()
+
+def _cache_key_part(value):
+    """Turn a chart argument into a hashable cache key component"""
+    if isinstance(value, pd.DataFrame):
+        return ('DataFrame', fingerprint_dataframe(value))
+    if isinstance(value, pd.Series):
+        return ('Series', str(value.name), fingerprint_dataframe(value.to_frame()))
+    if isinstance(value, dict):
+        return tuple((k, _cache_key_part(v)) for k, v in value.items())
+    if isinstance(value, np.ndarray):
+        if value.dtype != object:
+            data = np.ascontiguousarray(value).tobytes()
+            return ('ndarray', value.shape, str(value.dtype),
+                    hashlib.blake2b(data, digest_size=16).hexdigest())
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        # Recurse so nested sequences become nested tuples
+        return tuple(_cache_key_part(v) for v in value)
+    return value
+
+# Every cache created by cached_figure, so they can be dropped together
+_FIGURE_CACHES = []
+
+def cached_figure(maxsize=32):
+    """
+    Memoize a chart function on a fingerprint of its arguments.
+    
+    DataFrames are keyed by a content hash, so a rerun with identical data
+    reuses the previously built figure instead of constructing a new one.
+    Each caller gets its own copy, so changes to it don't leak into the cache.
+    
+    Args:
+        maxsize (int): Number of figures to keep (least recently used first out)
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+        _FIGURE_CACHES.append(cache)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (
+                tuple(_cache_key_part(a) for a in args),
+                tuple(sorted((k, _cache_key_part(v)) for k, v in kwargs.items()))
+            )
+            with lock:
+                fig = cache.get(key)
+                if fig is not None:
+                    cache.move_to_end(key)
+            
+            if fig is None:
+                fig = func(*args, **kwargs)
+                with lock:
+                    cache[key] = fig
+                    if len(cache) > maxsize:
+                        cache.popitem(last=False)
+            
+            return go.Figure(fig)
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+def clear_figure_caches():
+    """
+    Drop every memoized figure, e.g. after the underlying data was regenerated.
+    """
+    for cache in _FIGURE_CACHES:
+        cache.clear()
+
+# Series longer than this are downsampled before being sent to the browser
+MAX_CHART_POINTS = 2000
+
+def minmax_downsample_indices(values, n_bins):
+    """
+    Pick the row indices to keep when downsampling a long series for plotting.
+    
+    The series is split into equal-width bins and the minimum and maximum of
+    each bin are kept, so peaks and dips survive while the number of points
+    drawn stays at roughly 2 * n_bins regardless of the input length.
+    
+    Args:
+        values (np.ndarray): 1-D array of y values
+        n_bins (int): Number of bins to split the series into
+    
+    Returns:
+        np.ndarray: Sorted indices of the points to keep
+    """
+    n = len(values)
+    if n <= 2 * n_bins:
+        return np.arange(n)
+    
+    # Pad to a whole number of equal-width bins so the min/max search is a
+    # single reduction over a 2-D view instead of a Python loop per bin
+    bin_size = -(-n // n_bins)
+    n_bins = -(-n // bin_size)
+    padded = np.full(n_bins * bin_size, np.nan)
+    padded[:n] = values
+    blocks = padded.reshape(n_bins, bin_size)
+    offsets = np.arange(n_bins) * bin_size
+    
+    # Bins that are entirely NaN (gaps in the data) have no min/max to keep
+    has_data = ~np.isnan(blocks).all(axis=1)
+    blocks = blocks[has_data]
+    offsets = offsets[has_data]
+    
+    return np.unique(np.concatenate([
+        offsets + np.nanargmin(blocks, axis=1),
+        offsets + np.nanargmax(blocks, axis=1)
+    ]))
 
+@cached_figure()
 def create_consumption_chart(energy_data, time_period="Last 30 Days"):
     """
     Create an interactive line chart showing energy consumption over time.
@@ -63,11 +208,24 @@ def create_consumption_chart(energy_data, time_period="Last 30 Days"):
     # This is the foundation for all chart elements
     fig = go.Figure()
     
+    # Pull the consumption values out once; all statistics below reduce over
+    # this NumPy array instead of dispatching through pandas each time
+    cons = energy_data['consumption'].to_numpy()
+    
+    # Long series are reduced to per-bin min/max points so the browser only
+    # draws what is visible at chart resolution; statistics use the full data
+    plot_data = energy_data
+    if len(energy_data) > MAX_CHART_POINTS:
+        keep = minmax_downsample_indices(cons, MAX_CHART_POINTS // 2)
+        plot_data = energy_data.iloc[keep]
+    
+    # Traces get plain NumPy arrays (float32 for values) so Plotly can
+    # serialize them as typed arrays instead of element-by-element JSON
     # Add the main consumption trend line
-    # Using go.Scatter with mode='lines+markers' creates an interactive line chart
-    fig.add_trace(go.Scatter(
-        x=energy_data['date'],           # X-axis: dates
-        y=energy_data['consumption'],    # Y-axis: consumption values
+    # go.Scattergl renders with WebGL, which keeps pan/zoom fast on long series
+    fig.add_trace(go.Scattergl(
+        x=plot_data['date'].to_numpy(),                      # X-axis: dates
+        y=plot_data['consumption'].to_numpy(dtype=np.float32),  # Y-axis: consumption values
         mode='lines+markers',            # Display both lines and data points
         name='Daily Consumption',        # Legend label
         line=dict(color=COLORS['primary'], width=3),  # Line styling
@@ -78,7 +236,7 @@ def create_consumption_chart(energy_data, time_period="Last 30 Days"):
     
     # Add horizontal reference line showing average consumption
     # This helps users understand their performance relative to average
-    avg_consumption = energy_data['consumption'].mean()
+    avg_consumption = cons.mean()
     fig.add_hline(
         y=avg_consumption,                    # Y position of the line
         line_dash="dash",                     # Dashed line style
@@ -92,16 +250,18 @@ def create_consumption_chart(energy_data, time_period="Last 30 Days"):
     if len(energy_data) > 7:  # Only add trend if enough data points
         # Use numpy's polyfit to calculate linear trend
         # polyfit returns coefficients for polynomial (linear in this case)
-        z = np.polyfit(range(len(energy_data)), energy_data['consumption'], 1)
-        p = np.poly1d(z)  # Create polynomial function from coefficients
+        x_int = np.arange(len(cons))
+        z = np.polyfit(x_int, cons, 1)
         
-        # Calculate trend line y-values for all x-positions
-        trend_y = [p(i) for i in range(len(energy_data))]
+        # The trend is a straight line, so its two end points are all the
+        # browser needs, however long the series is
+        ends = x_int[[0, -1]]
+        trend_y = np.polyval(z, ends)
         
         # Add trend line to the chart
-        fig.add_trace(go.Scatter(
-            x=energy_data['date'],
-            y=trend_y,
+        fig.add_trace(go.Scattergl(
+            x=energy_data['date'].to_numpy()[ends],
+            y=trend_y.astype(np.float32),
             mode='lines',                     # Only lines, no markers
             name='Trend',
             line=dict(color=COLORS['warning'], width=2, dash='dot'),
@@ -110,17 +270,13 @@ def create_consumption_chart(energy_data, time_period="Last 30 Days"):
     
     # Customize the chart layout for dark theme and professional appearance
     fig.update_layout(
+        **DARK_LAYOUT,                      # Shared dark theme styling
         title=f'Energy Consumption Trend - {time_period}',
         xaxis_title='Date',
         yaxis_title='Consumption (kWh)',
         hovermode='x unified',              # Show all hover info at once
         showlegend=True,                    # Display legend
-        height=400,                         # Chart height
-        # Dark theme colors
-        plot_bgcolor='rgba(0,0,0,0)',       # Transparent plot background
-        paper_bgcolor='rgba(0,0,0,0)',      # Transparent paper background
-        font=dict(family="Arial", size=12, color='#e0e0e0'),  # Font styling
-        title_font=dict(size=16, color='#f0f0f0')  # Title font
+        height=400                          # Chart height
     )
     
     # Customize grid lines for better readability
@@ -137,6 +293,7 @@ def create_consumption_chart(energy_data, time_period="Last 30 Days"):
     
     return fig
 
+@cached_figure()
 def create_appliance_breakdown(appliance_data):
     """
     Create a pie chart showing energy consumption by appliance.
@@ -148,8 +305,8 @@ def create_appliance_breakdown(appliance_data):
         plotly.graph_objects.Figure: Interactive pie chart
     """
     fig = go.Figure(data=[go.Pie(
-        labels=appliance_data['appliance'],
-        values=appliance_data['daily_kwh'],
+        labels=appliance_data['appliance'].to_numpy(),
+        values=appliance_data['daily_kwh'].to_numpy(dtype=np.float32),
         hole=0.4,
         textinfo='label+percent',
         textposition='auto',
@@ -158,14 +315,10 @@ def create_appliance_breakdown(appliance_data):
     )])
     
     fig.update_layout(
+        **DARK_LAYOUT,
         title='Energy Consumption by Appliance',
         showlegend=True,
         height=400,
-        # Dark theme styling
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(family="Arial", size=12, color='#e0e0e0'),
-        title_font=dict(size=16, color='#f0f0f0'),
         legend=dict(
             orientation="v", 
             yanchor="middle", 
@@ -178,6 +331,7 @@ def create_appliance_breakdown(appliance_data):
     
     return fig
 
+@cached_figure()
 def create_cost_analysis(energy_data, rate_per_kwh=0.12):
     """
     Create a chart showing cost analysis over time.
@@ -189,10 +343,11 @@ def create_cost_analysis(energy_data, rate_per_kwh=0.12):
     Returns:
         plotly.graph_objects.Figure: Cost analysis chart
     """
-    # Calculate costs
-    energy_data = energy_data.copy()
-    energy_data['daily_cost'] = energy_data['consumption'] * rate_per_kwh
-    energy_data['cumulative_cost'] = energy_data['daily_cost'].cumsum()
+    # Calculate costs as local arrays (the input DataFrame is left untouched)
+    consumption = energy_data['consumption'].to_numpy(dtype=np.float32)
+    daily_cost = consumption * np.float32(rate_per_kwh)
+    cumulative_cost = np.cumsum(daily_cost)
+    dates = energy_data['date'].to_numpy()
     
     # Create subplot with secondary y-axis
     fig = make_subplots(specs=[[{"secondary_y": True}]])
@@ -200,8 +355,8 @@ def create_cost_analysis(energy_data, rate_per_kwh=0.12):
     # Add daily cost bars
     fig.add_trace(
         go.Bar(
-            x=energy_data['date'],
-            y=energy_data['daily_cost'],
+            x=dates,
+            y=daily_cost,
             name='Daily Cost',
             marker_color=COLORS['info'],
             opacity=0.7,
@@ -210,11 +365,11 @@ def create_cost_analysis(energy_data, rate_per_kwh=0.12):
         secondary_y=False,
     )
     
-    # Add cumulative cost line
+    # Add cumulative cost line (WebGL-rendered like the consumption chart)
     fig.add_trace(
-        go.Scatter(
-            x=energy_data['date'],
-            y=energy_data['cumulative_cost'],
+        go.Scattergl(
+            x=dates,
+            y=cumulative_cost,
             mode='lines+markers',
             name='Cumulative Cost',
             line=dict(color=COLORS['danger'], width=3),
@@ -229,19 +384,16 @@ def create_cost_analysis(energy_data, rate_per_kwh=0.12):
     fig.update_yaxes(title_text="Cumulative Cost ($)", secondary_y=True)
     
     fig.update_layout(
+        **DARK_LAYOUT,
         title='Energy Cost Analysis',
         xaxis_title='Date',
         hovermode='x unified',
-        height=400,
-        # Dark theme styling
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(family="Arial", size=12, color='#e0e0e0'),
-        title_font=dict(size=16, color='#f0f0f0')
+        height=400
     )
     
     return fig
 
+@cached_figure()
 def create_hourly_pattern_chart(hourly_data):
     """
     Create a chart showing hourly consumption patterns.
@@ -262,31 +414,40 @@ def create_hourly_pattern_chart(hourly_data):
         'Evening': COLORS['danger']
     }
     
-    for period in hourly_data['period'].unique():
-        period_data = hourly_data[hourly_data['period'] == period]
-        
-        fig.add_trace(go.Bar(
-            x=period_data['time'],
-            y=period_data['consumption'],
-            name=period,
-            marker_color=colors.get(period, COLORS['accent']),
-            hovertemplate='<b>%{x}</b><br>%{y:.2f} kWh<br>Period: ' + period + '<extra></extra>'
+    # One bar trace for all hours, colored per bar by its period
+    periods = hourly_data['period'].astype(str)
+    color_array = periods.map(colors).fillna(COLORS['accent']).to_numpy()
+    
+    fig.add_trace(go.Bar(
+        x=hourly_data['time'].to_numpy(),
+        y=hourly_data['consumption'].to_numpy(),
+        marker_color=color_array,
+        customdata=periods.to_numpy(),
+        showlegend=False,
+        hovertemplate='<b>%{x}</b><br>%{y:.2f} kWh<br>Period: %{customdata}<extra></extra>'
+    ))
+    
+    # Lightweight marker-only traces provide the legend entries per period
+    for period in periods.unique():
+        fig.add_trace(go.Scatter(
+            x=[None],
+            y=[None],
+            mode='markers',
+            marker=dict(symbol='square', size=12, color=colors.get(period, COLORS['accent'])),
+            name=period
         ))
     
     fig.update_layout(
+        **DARK_LAYOUT,
         title='Hourly Energy Consumption Pattern',
         xaxis_title='Time of Day',
         yaxis_title='Consumption (kWh)',
-        height=400,
-        barmode='group',
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(family="Arial", size=12),
-        title_font=dict(size=16, color=COLORS['primary'])
+        height=400
     )
     
     return fig
 
+@cached_figure()
 def create_efficiency_comparison(appliance_data):
     """
     Create a chart comparing appliance efficiency ratings.
@@ -297,46 +458,44 @@ def create_efficiency_comparison(appliance_data):
     Returns:
         plotly.graph_objects.Figure: Efficiency comparison chart
     """
-    # Convert efficiency ratings to numeric scores
-    efficiency_scores = {
-        'A+++': 10, 'A++': 9, 'A+': 8, 'A': 7, 'B': 6, 'C': 5, 'D': 4
-    }
-    
-    appliance_data = appliance_data.copy()
-    appliance_data['efficiency_score'] = appliance_data['efficiency_rating'].map(efficiency_scores)
+    # Convert efficiency ratings to numeric scores by gathering on the
+    # category codes (unknown ratings get code -1 and no score)
+    ratings = appliance_data['efficiency_rating']
+    if not isinstance(ratings.dtype, pd.CategoricalDtype) or list(ratings.cat.categories) != EFFICIENCY_RATINGS:
+        ratings = ratings.astype(pd.CategoricalDtype(EFFICIENCY_RATINGS, ordered=True))
+    codes = ratings.cat.codes.to_numpy()
+    efficiency_score = np.where(codes >= 0, EFFICIENCY_SCORES[codes], np.nan)
     
     fig = go.Figure()
     
     # Create bubble chart
     fig.add_trace(go.Scatter(
-        x=appliance_data['daily_kwh'],
-        y=appliance_data['efficiency_score'],
+        x=appliance_data['daily_kwh'].to_numpy(dtype=np.float32),
+        y=efficiency_score,
         mode='markers+text',
         marker=dict(
-            size=appliance_data['daily_cost'] * 5,  # Size based on cost
-            color=appliance_data['efficiency_score'],
+            size=appliance_data['daily_cost'].to_numpy(dtype=np.float32) * 5,  # Size based on cost
+            color=efficiency_score,
             colorscale='RdYlGn',
             showscale=True,
             colorbar=dict(title="Efficiency Score")
         ),
-        text=appliance_data['appliance'],
+        text=appliance_data['appliance'].to_numpy(),
         textposition='top center',
         hovertemplate='<b>%{text}</b><br>Consumption: %{x:.1f} kWh<br>Efficiency: %{y}/10<extra></extra>'
     ))
     
     fig.update_layout(
+        **DARK_LAYOUT,
         title='Appliance Efficiency vs Consumption',
         xaxis_title='Daily Consumption (kWh)',
         yaxis_title='Efficiency Score (10 = Best)',
-        height=500,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(family="Arial", size=12),
-        title_font=dict(size=16, color=COLORS['primary'])
+        height=500
     )
     
     return fig
 
+@cached_figure()
 def create_seasonal_analysis(energy_data):
     """
     Create a chart showing seasonal energy consumption patterns.
@@ -347,32 +506,32 @@ def create_seasonal_analysis(energy_data):
     Returns:
         plotly.graph_objects.Figure: Seasonal analysis chart
     """
-    seasonal_data = energy_data.groupby('season')['consumption'].agg(['mean', 'std']).reset_index()
+    # With 'season' as a Categorical, observed=True skips empty seasons and the
+    # groups come out in category (calendar) order without a string sort
+    seasonal_data = energy_data.groupby('season', observed=True)['consumption'].agg(['mean', 'std'])
     
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        x=seasonal_data['season'],
-        y=seasonal_data['mean'],
-        error_y=dict(type='data', array=seasonal_data['std']),
+        x=seasonal_data.index.to_numpy(),
+        y=seasonal_data['mean'].to_numpy(),
+        error_y=dict(type='data', array=seasonal_data['std'].to_numpy()),
         name='Average Consumption',
         marker_color=PLOTLY_COLORS,
         hovertemplate='<b>%{x}</b><br>Average: %{y:.1f} kWh<extra></extra>'
     ))
     
     fig.update_layout(
+        **DARK_LAYOUT,
         title='Seasonal Energy Consumption Analysis',
         xaxis_title='Season',
         yaxis_title='Average Consumption (kWh)',
-        height=400,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(family="Arial", size=12),
-        title_font=dict(size=16, color=COLORS['primary'])
+        height=400
     )
     
     return fig
 
+@cached_figure()
 def create_comparison_chart(data_dict, title="Comparison"):
     """
     Create a comparison chart for multiple datasets.
@@ -386,26 +545,25 @@ def create_comparison_chart(data_dict, title="Comparison"):
     """
     fig = go.Figure()
     
-    colors = PLOTLY_COLORS[:len(data_dict)]
+    n_colors = len(PLOTLY_COLORS)
     
     for i, (label, values) in enumerate(data_dict.items()):
+        # NumPy arrays are sent to the browser as compact binary buffers
+        values = np.asarray(values, dtype=np.float32)
         fig.add_trace(go.Bar(
             name=label,
-            x=list(range(len(values))),
+            x=np.arange(len(values)),
             y=values,
-            marker_color=colors[i % len(colors)]
+            marker_color=PLOTLY_COLORS[i % n_colors]
         ))
     
     fig.update_layout(
+        **DARK_LAYOUT,
         title=title,
         xaxis_title='Time Period',
         yaxis_title='Value',
         barmode='group',
-        height=400,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(family="Arial", size=12),
-        title_font=dict(size=16, color=COLORS['primary'])
+        height=400
     )
     
     return fig
@@ -6,27 +6,136 @@ This module demonstrates:
 - Working with dates and time series
 - Creating realistic data patterns
 - Using random data generation
-- Pandas DataFrame operations
+- Pandas DataFrame operations (frames built column-wise from NumPy arrays)
 """
 
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import random
 from faker import Faker
 
+# Numba is optional: when installed, the daily consumption simulation is
+# JIT-compiled; otherwise an equivalent vectorized NumPy version is used
+from utils._accel import njit, NUMBA_AVAILABLE
+
+# Below this many days the JIT dispatch/compile cost outweighs the kernel itself
+JIT_MIN_DAYS = 30
+
 fake = Faker()
 
-def generate_energy_data(days=30, house_type="Medium House"):
+# Category orders for repeated string columns (stored as pandas Categoricals)
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+          'August', 'September', 'October', 'November', 'December']
+SEASONS = ['Winter', 'Spring', 'Summer', 'Fall']
+EFFICIENCY_RATINGS = ['A+++', 'A++', 'A+', 'A', 'B', 'C', 'D']
+
+# Lookup tables replacing per-row if/elif chains
+# Season by month number (index 0 is unused so months index directly)
+SEASON_BY_MONTH = np.array([
+    '', 'Winter', 'Winter', 'Spring', 'Spring', 'Spring', 'Summer',
+    'Summer', 'Summer', 'Fall', 'Fall', 'Fall', 'Winter'
+])
+
+# Time periods in the order they first occur in a day
+TIME_PERIODS = ['Night', 'Morning', 'Afternoon', 'Evening']
+
+# Time period by hour of day (0-23)
+PERIOD_BY_HOUR = np.array(
+    ['Night'] * 5 + ['Morning'] * 7 + ['Afternoon'] * 5 + ['Evening'] * 5 + ['Night'] * 2
+)
+
+# Seasonal sinusoids depend only on the day of year, so they are tabulated
+# once at import (index = day_of_year - 1) instead of calling np.sin per day
+DAY_OF_YEAR = np.arange(1, 367)
+ANNUAL_CYCLE = np.sin(2 * np.pi * DAY_OF_YEAR / 365)
+SEASONAL_FACTOR = 1 + 0.3 * ANNUAL_CYCLE
+TEMP_FACTOR = 1 + 0.2 * np.sin(2 * np.pi * DAY_OF_YEAR / 365 + np.pi)
+
+# Typical daily usage pattern (multipliers for each hour)
+HOURLY_PATTERN = np.array([
+    0.6, 0.5, 0.4, 0.4, 0.5, 0.7,  # 0-5 AM (low usage)
+    1.2, 1.8, 1.5, 1.0, 0.8, 0.9,  # 6-11 AM (morning peak)
+    1.0, 0.9, 0.8, 0.8, 1.1, 1.4,  # 12-5 PM (afternoon)
+    1.8, 2.0, 1.9, 1.6, 1.2, 0.9   # 6-11 PM (evening peak)
+])
+
+# Hour labels for the hourly data ("00:00" ... "23:00")
+HOUR_LABELS = [f"{hour:02d}:00" for hour in range(24)]
+
+# Explicit signature: compiled once at import (or loaded from the disk cache)
+# and never re-specialized for other input dtypes
+@njit('float32[:](float64, int64[:], int64[:], float64[:], float64[:], float64[:])',
+      cache=True, fastmath=True)
+def simulate_consumption(base_kwh, day_of_year, weekday, random_factor, spike_draw, spike_factor):
+    """
+    Simulate daily consumption values from pre-drawn random numbers.
+    
+    All factors, the optional spike and the rounding are fused into a single
+    pass, so no intermediate arrays are allocated. When compiled, the
+    signature is fixed: int64 day arrays and float64 random arrays.
+    
+    Args:
+        base_kwh (float): Base daily consumption for the house type
+        day_of_year (np.ndarray): Day of year (1-366) for each day
+        weekday (np.ndarray): Day of week (0 = Monday) for each day
+        random_factor (np.ndarray): Daily variation factors in [0.8, 1.2)
+        spike_draw (np.ndarray): Uniform [0, 1) draws deciding spike days
+        spike_factor (np.ndarray): Spike multipliers in [1.5, 2.0)
+    
+    Returns:
+        np.ndarray: Daily consumption in kWh rounded to 0.01 (float32)
+    """
+    n = day_of_year.shape[0]
+    out = np.empty(n, dtype=np.float32)
+    for i in range(n):
+        # Base consumption with seasonal variation
+        seasonal_factor = SEASONAL_FACTOR[day_of_year[i] - 1]
+        
+        # Weekend vs weekday pattern
+        weekend_factor = 1.2 if weekday[i] >= 5 else 0.9
+        
+        # Weather simulation (temperature effects)
+        temp_factor = TEMP_FACTOR[day_of_year[i] - 1]
+        
+        daily_consumption = base_kwh * seasonal_factor * weekend_factor * temp_factor * random_factor[i]
+        
+        # Add some random spikes for special events
+        if spike_draw[i] < 0.05:  # 5% chance of high usage day
+            daily_consumption *= spike_factor[i]
+        
+        out[i] = round(daily_consumption, 2)
+    return out
+
+def simulate_consumption_numpy(base_kwh, day_of_year, weekday, random_factor, spike_draw, spike_factor):
+    """
+    Vectorized NumPy version of simulate_consumption.
+    
+    Used for short ranges and when numba is not installed; every factor is
+    computed as a whole-array operation instead of a per-day loop.
+    
+    Returns:
+        np.ndarray: Daily consumption in kWh rounded to 0.01 (float32)
+    """
+    seasonal_factor = SEASONAL_FACTOR[day_of_year - 1]
+    weekend_factor = np.where(weekday >= 5, 1.2, 0.9)
+    temp_factor = TEMP_FACTOR[day_of_year - 1]
+    spike = np.where(spike_draw < 0.05, spike_factor, 1.0)
+    
+    consumption = base_kwh * seasonal_factor * weekend_factor * temp_factor * random_factor * spike
+    return np.round(consumption, 2).astype(np.float32)
+
+def generate_energy_data(days=30, house_type="Medium House", rng=None):
     """
     Generate realistic energy consumption data for a specified period.
     
     Args:
         days (int): Number of days to generate data for
         house_type (str): Type of house (affects base consumption)
+        rng (np.random.Generator | int | None): Random generator or seed (fresh generator if None)
     
     Returns:
-        pandas.DataFrame: DataFrame with date and consumption columns
+        pandas.DataFrame: DataFrame with date and consumption (float32) columns
     """
     # Base consumption levels by house type
     base_consumption = {
@@ -39,51 +148,49 @@ def generate_energy_data(days=30, house_type="Medium House"):
     base_kwh = base_consumption.get(house_type, 25)
     
     # Generate date range
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
-    date_range = pd.date_range(start=start_date, end=end_date, freq='D')
+    # A normalized (midnight) DatetimeIndex keeps the 'date' column as
+    # datetime64[ns]; the range covers today plus the previous `days` days
+    date_range = pd.date_range(end=pd.Timestamp.today().normalize(), periods=days + 1, freq='D')
     
-    consumption_data = []
+    # Draw all random numbers up front as arrays
+    n = len(date_range)
+    rng = np.random.default_rng(rng)
+    random_factor = rng.uniform(0.8, 1.2, n)   # Random daily variation
+    spike_draw = rng.random(n)                  # Chance of a high usage day
+    spike_factor = rng.uniform(1.5, 2.0, n)     # Size of the spike
     
-    for date in date_range:
-        # Base consumption with seasonal variation
-        seasonal_factor = 1 + 0.3 * np.sin(2 * np.pi * date.dayofyear / 365)
-        
-        # Weekend vs weekday pattern
-        if date.weekday() >= 5:  # Weekend
-            weekend_factor = 1.2
-        else:  # Weekday
-            weekend_factor = 0.9
-        
-        # Weather simulation (temperature effects)
-        temp_factor = 1 + 0.2 * np.sin(2 * np.pi * date.dayofyear / 365 + np.pi)
-        
-        # Random daily variation
-        random_factor = random.uniform(0.8, 1.2)
-        
-        # Calculate daily consumption
-        daily_consumption = base_kwh * seasonal_factor * weekend_factor * temp_factor * random_factor
-        
-        # Add some random spikes for special events
-        if random.random() < 0.05:  # 5% chance of high usage day
-            daily_consumption *= random.uniform(1.5, 2.0)
-        
-        consumption_data.append({
-            'date': date,
-            'consumption': round(daily_consumption, 2),
-            'weekday': date.strftime('%A'),
-            'month': date.strftime('%B'),
-            'season': get_season(date)
-        })
-    
-    return pd.DataFrame(consumption_data)
+    # The compiled kernel only pays off for longer ranges
+    if NUMBA_AVAILABLE and n >= JIT_MIN_DAYS:
+        kernel = simulate_consumption
+    else:
+        kernel = simulate_consumption_numpy
+    
+    # float32 is plenty for daily kWh and halves memory and chart payloads
+    consumption = kernel(
+        float(base_kwh),
+        date_range.dayofyear.to_numpy(dtype=np.int64),
+        date_range.weekday.to_numpy(dtype=np.int64),
+        random_factor,
+        spike_draw,
+        spike_factor
+    )
+    
+    # Build the DataFrame column-at-a-time from whole-range operations
+    return pd.DataFrame({
+        'date': date_range,
+        'consumption': consumption,
+        'weekday': pd.Categorical(date_range.day_name(), categories=WEEKDAYS),
+        'month': pd.Categorical(date_range.month_name(), categories=MONTHS),
+        'season': pd.Categorical(SEASON_BY_MONTH[date_range.month.to_numpy()], categories=SEASONS)
+    })
 
-def generate_appliance_data(house_type="Medium House"):
+def generate_appliance_data(house_type="Medium House", rng=None):
     """
     Generate realistic appliance consumption data.
     
     Args:
         house_type (str): Type of house (affects appliance usage)
+        rng (np.random.Generator | int | None): Random generator or seed (fresh generator if None)
     
     Returns:
         pandas.DataFrame: DataFrame with appliance consumption data
@@ -137,42 +244,46 @@ def generate_appliance_data(house_type="Medium House"):
     
     appliances = appliance_patterns.get(house_type, appliance_patterns["Medium House"])
     
-    appliance_data = []
-    for appliance, base_kwh in appliances.items():
-        # Add some random variation
-        actual_kwh = base_kwh * random.uniform(0.85, 1.15)
-        
-        # Calculate cost (assuming $0.12 per kWh)
-        daily_cost = actual_kwh * 0.12
-        monthly_cost = daily_cost * 30
-        
-        # Efficiency rating (simulate)
-        efficiency = random.choice(['A+++', 'A++', 'A+', 'A', 'B', 'C'])
-        
-        appliance_data.append({
-            'appliance': appliance,
-            'daily_kwh': round(actual_kwh, 2),
-            'daily_cost': round(daily_cost, 2),
-            'monthly_cost': round(monthly_cost, 2),
-            'efficiency_rating': efficiency,
-            'percentage': 0  # Will be calculated after all data is collected
-        })
-    
-    df = pd.DataFrame(appliance_data)
-    
-    # Calculate percentages
-    total_consumption = df['daily_kwh'].sum()
-    df['percentage'] = round((df['daily_kwh'] / total_consumption) * 100, 1)
-    
-    return df.sort_values('daily_kwh', ascending=False)
+    names = list(appliances.keys())
+    base_kwh = np.array(list(appliances.values()))
+    n = len(names)
+    rng = np.random.default_rng(rng)
+    
+    # Add some random variation, drawn for all appliances at once
+    actual_kwh = base_kwh * rng.uniform(0.85, 1.15, n)
+    
+    # Calculate cost (assuming $0.12 per kWh)
+    daily_cost = actual_kwh * 0.12
+    monthly_cost = daily_cost * 30
+    
+    # Efficiency rating (simulate; 'D' is never generated)
+    efficiency = rng.choice(EFFICIENCY_RATINGS[:-1], size=n)
+    
+    df = pd.DataFrame({
+        'appliance': names,
+        'daily_kwh': actual_kwh,
+        'daily_cost': daily_cost,
+        'monthly_cost': monthly_cost,
+        'efficiency_rating': pd.Categorical(efficiency, categories=EFFICIENCY_RATINGS, ordered=True),
+        'percentage': actual_kwh / actual_kwh.sum() * 100
+    })
+    
+    # Round for display in one vectorized pass over the finished frame. These
+    # columns stay float64: rounded float32 values such as 12.54 are really
+    # 12.539999961853027, which shows up in unformatted chart hovers
+    df = df.round({'daily_kwh': 2, 'daily_cost': 2, 'monthly_cost': 2, 'percentage': 1})
+    
+    # Sorted once here (largest first) so charts can use the order as-is
+    return df.sort_values('daily_kwh', ascending=False, kind='stable').reset_index(drop=True)
 
-def generate_hourly_data(date=None, house_type="Medium House"):
+def generate_hourly_data(date=None, house_type="Medium House", rng=None):
     """
     Generate hourly consumption data for a specific day.
     
     Args:
         date (datetime): Date to generate data for (defaults to today)
         house_type (str): Type of house
+        rng (np.random.Generator | int | None): Random generator or seed (fresh generator if None)
     
     Returns:
         pandas.DataFrame: DataFrame with hourly consumption data
@@ -189,57 +300,37 @@ def generate_hourly_data(date=None, house_type="Medium House"):
     
     base_hourly = base_consumption.get(house_type, 1.2)
     
-    # Typical daily usage pattern (multipliers for each hour)
-    hourly_pattern = [
-        0.6, 0.5, 0.4, 0.4, 0.5, 0.7,  # 0-5 AM (low usage)
-        1.2, 1.8, 1.5, 1.0, 0.8, 0.9,  # 6-11 AM (morning peak)
-        1.0, 0.9, 0.8, 0.8, 1.1, 1.4,  # 12-5 PM (afternoon)
-        1.8, 2.0, 1.9, 1.6, 1.2, 0.9   # 6-11 PM (evening peak)
-    ]
-    
-    hourly_data = []
-    for hour in range(24):
-        # Base pattern with random variation
-        consumption = base_hourly * hourly_pattern[hour] * random.uniform(0.8, 1.2)
-        
-        hourly_data.append({
-            'hour': hour,
-            'consumption': round(consumption, 3),
-            'time': f"{hour:02d}:00",
-            'period': get_time_period(hour)
-        })
-    
-    return pd.DataFrame(hourly_data)
+    # Base pattern with random variation, drawn for all 24 hours at once
+    rng = np.random.default_rng(rng)
+    consumption = np.round(base_hourly * HOURLY_PATTERN * rng.uniform(0.8, 1.2, 24), 3)
+    
+    # Hours fit in int8 and kWh in float32; no column needs 64 bits
+    return pd.DataFrame({
+        'hour': np.arange(24, dtype=np.int8),
+        'consumption': consumption.astype(np.float32),
+        'time': HOUR_LABELS,
+        'period': pd.Categorical(PERIOD_BY_HOUR, categories=TIME_PERIODS)
+    })
 
 def get_season(date):
     """Get season based on date"""
-    month = date.month
-    if month in [12, 1, 2]:
-        return "Winter"
-    elif month in [3, 4, 5]:
-        return "Spring"
-    elif month in [6, 7, 8]:
-        return "Summer"
-    else:
-        return "Fall"
+    return str(SEASON_BY_MONTH[date.month])
 
 def get_time_period(hour):
     """Get time period description"""
-    if 5 <= hour < 12:
-        return "Morning"
-    elif 12 <= hour < 17:
-        return "Afternoon"
-    elif 17 <= hour < 22:
-        return "Evening"
-    else:
+    # Anything outside 0-23 (including NaN) is Night, as the original
+    # if/elif chain returned; fractional hours use their whole hour
+    if not 0 <= hour < 24:
         return "Night"
+    return str(PERIOD_BY_HOUR[int(hour)])
 
-def generate_weather_data(days=30):
+def generate_weather_data(days=30, rng=None):
     """
     Generate weather data that affects energy consumption.
     
     Args:
         days (int): Number of days to generate data for
+        rng (np.random.Generator | int | None): Random generator or seed (fresh generator if None)
     
     Returns:
         pandas.DataFrame: DataFrame with weather data
@@ -248,28 +339,30 @@ def generate_weather_data(days=30):
     start_date = end_date - timedelta(days=days)
     date_range = pd.date_range(start=start_date, end=end_date, freq='D')
     
-    weather_data = []
-    for date in date_range:
-        # Seasonal temperature variation
-        base_temp = 70 + 25 * np.sin(2 * np.pi * date.dayofyear / 365)
-        temp = base_temp + random.uniform(-10, 10)
-        
-        # Humidity (affects comfort and AC usage)
-        humidity = random.uniform(30, 80)
-        
-        # Weather conditions
-        conditions = random.choices(
-            ['Sunny', 'Partly Cloudy', 'Cloudy', 'Rainy', 'Stormy'],
-            weights=[40, 30, 20, 8, 2]
-        )[0]
-        
-        weather_data.append({
-            'date': date,
-            'temperature': round(temp, 1),
-            'humidity': round(humidity, 1),
-            'conditions': conditions,
-            'heating_degree_days': max(0, 65 - temp),
-            'cooling_degree_days': max(0, temp - 75)
-        })
-    
-    return pd.DataFrame(weather_data)
+    n = len(date_range)
+    rng = np.random.default_rng(rng)
+    
+    # Seasonal temperature variation
+    day_of_year = date_range.dayofyear.to_numpy()
+    base_temp = 70 + 25 * ANNUAL_CYCLE[day_of_year - 1]
+    temp = base_temp + rng.uniform(-10, 10, n)
+    
+    # Humidity (affects comfort and AC usage)
+    humidity = rng.uniform(30, 80, n)
+    
+    # Weather conditions
+    conditions = rng.choice(
+        ['Sunny', 'Partly Cloudy', 'Cloudy', 'Rainy', 'Stormy'],
+        p=[0.4, 0.3, 0.2, 0.08, 0.02],
+        size=n
+    )
+    
+    # Weather readings need far less than float64 precision
+    return pd.DataFrame({
+        'date': date_range,
+        'temperature': np.round(temp, 1).astype(np.float32),
+        'humidity': np.round(humidity, 1).astype(np.float32),
+        'conditions': conditions,
+        'heating_degree_days': np.clip(65 - temp, 0, None).astype(np.float32),
+        'cooling_degree_days': np.clip(temp - 75, 0, None).astype(np.float32)
+    })
@@ -0,0 +1 @@
+# Lets the tests import the app packages (components, utils) from the repo root
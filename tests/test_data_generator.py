@@ -0,0 +1,40 @@
+"""
+Tests for the data generator lookup helpers.
+"""
+
+import math
+
+import pytest
+
+from components.data_generator import get_time_period
+
+
+@pytest.mark.parametrize("hour, expected", [
+    (0, "Night"),
+    (4, "Night"),
+    (5, "Morning"),
+    (11, "Morning"),
+    (12, "Afternoon"),
+    (16, "Afternoon"),
+    (17, "Evening"),
+    (21, "Evening"),
+    (22, "Night"),
+    (23, "Night"),
+])
+def test_get_time_period_whole_hours(hour, expected):
+    assert get_time_period(hour) == expected
+
+
+@pytest.mark.parametrize("hour, expected", [
+    (14.0, "Afternoon"),
+    (11.5, "Morning"),
+    (4.9, "Night"),
+    (21.99, "Evening"),
+])
+def test_get_time_period_float_hours(hour, expected):
+    assert get_time_period(hour) == expected
+
+
+@pytest.mark.parametrize("hour", [24, 25, 100, -1, -0.5, math.nan])
+def test_get_time_period_out_of_range_is_night(hour):
+    assert get_time_period(hour) == "Night"
@@ -0,0 +1,151 @@
+"""
+Accelerated Kernels Module
+Numba-compiled numeric kernels used by the helper functions, and the
+optional-Numba setup (njit, NUMBA_AVAILABLE) shared with the data generator.
+
+This module demonstrates:
+- Optional dependencies with a graceful fallback
+- JIT compilation with an on-disk cache
+- Single-pass numeric algorithms (Welford's variance)
+"""
+
+import os
+import numpy as np
+
+# Numba is optional: when installed, kernels decorated with njit (here and in
+# components.data_generator) are JIT-compiled; otherwise they stay plain
+# Python and callers use NumPy/pandas code paths instead.
+# Compiled kernels are cached on disk so the compile cost is paid once.
+os.environ.setdefault(
+    'NUMBA_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.numba_cache')
+)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled"""
+        return lambda func: func
+
+@njit(cache=True)
+def clean_mask(consumption):
+    """
+    Flag the rows kept by clean_energy_data.
+    
+    Mean and sample standard deviation of the non-negative values are
+    accumulated in one pass (Welford's method), then a second pass marks
+    values that are non-negative and within 5 standard deviations above the
+    mean. NaN values are never kept.
+    
+    Args:
+        consumption (np.ndarray): Consumption values
+    
+    Returns:
+        np.ndarray: Boolean mask of rows to keep
+    """
+    n = consumption.shape[0]
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        x = consumption[i]
+        if x >= 0:
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+    
+    # Like pandas, the standard deviation of fewer than 2 values is NaN
+    std = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+    upper_limit = mean + 5 * std
+    
+    mask = np.empty(n, dtype=np.bool_)
+    for i in range(n):
+        x = consumption[i]
+        mask[i] = x >= 0 and x <= upper_limit
+    return mask
+
+@njit(cache=True)
+def summary_kernel(consumption):
+    """
+    Compute the statistics behind generate_usage_summary in a single pass.
+    
+    NaN values are skipped, matching pandas reductions.
+    
+    Args:
+        consumption (np.ndarray): Daily consumption values in date order
+    
+    Returns:
+        tuple: (total, mean, std, argmax, argmin, first-7 mean, last-7 mean)
+    
+    Raises:
+        ValueError: If there are no non-NaN values (as np.nanargmax does)
+    """
+    n = consumption.shape[0]
+    count = 0
+    total = 0.0
+    running_mean = 0.0
+    m2 = 0.0
+    argmax = -1
+    argmin = -1
+    head_sum = 0.0
+    head_count = 0
+    tail_sum = 0.0
+    tail_count = 0
+    for i in range(n):
+        x = consumption[i]
+        if np.isnan(x):
+            continue
+        count += 1
+        total += x
+        # Welford update for the variance
+        delta = x - running_mean
+        running_mean += delta / count
+        m2 += delta * (x - running_mean)
+        # Strict comparisons keep the first occurrence, like idxmax/idxmin
+        if argmax < 0 or x > consumption[argmax]:
+            argmax = i
+        if argmin < 0 or x < consumption[argmin]:
+            argmin = i
+        if i < 7:
+            head_sum += x
+            head_count += 1
+        if i >= n - 7:
+            tail_sum += x
+            tail_count += 1
+    
+    # No peak/low day exists; fail like the NumPy path instead of
+    # returning -1 positions
+    if count == 0:
+        raise ValueError("consumption has no non-NaN values")
+    
+    mean = total / count
+    std = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+    head_mean = head_sum / head_count if head_count > 0 else np.nan
+    tail_mean = tail_sum / tail_count if tail_count > 0 else np.nan
+    return total, mean, std, argmax, argmin, head_mean, tail_mean
+
+# Reassociation lets LLVM vectorize the sum; the no-NaN fast-math flags are
+# left out so the NaN check is not optimized away
+@njit(cache=True, fastmath={'reassoc', 'contract'})
+def mean_kernel(values):
+    """
+    Mean of the non-NaN values, matching pandas' Series.mean.
+    
+    Args:
+        values (np.ndarray): Values to average
+    
+    Returns:
+        float: Mean, or NaN when there are no values
+    """
+    total = 0.0
+    count = 0
+    for i in range(values.shape[0]):
+        x = values[i]
+        if not np.isnan(x):
+            total += x
+            count += 1
+    return total / count if count > 0 else np.nan
@@ -13,6 +13,11 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import json
+import os
+import copy
+from functools import lru_cache
+
+from utils._accel import NUMBA_AVAILABLE, clean_mask, summary_kernel, mean_kernel
 
 def format_currency(amount, include_cents=True):
     """
@@ -30,6 +35,21 @@ def format_currency(amount, include_cents=True):
     else:
         return f"${amount:,.0f}"
 
+def format_currency_array(amounts, include_cents=True):
+    """
+    Format many numbers as currency in one call.
+    
+    Args:
+        amounts (array-like): Amounts to format (list, ndarray or Series)
+        include_cents (bool): Whether to include cents
+    
+    Returns:
+        list: Formatted currency strings
+    """
+    fmt = "${:,.2f}".format if include_cents else "${:,.0f}".format
+    # tolist() hands back plain Python floats, avoiding a NumPy scalar per element
+    return [fmt(amount) for amount in np.asarray(amounts).tolist()]
+
 def format_energy(kwh, unit="kWh"):
     """
     Format energy consumption with appropriate units.
@@ -43,18 +63,48 @@ def format_energy(kwh, unit="kWh"):
     """
     return f"{kwh:,.1f} {unit}"
 
+def format_energy_array(kwh, unit="kWh"):
+    """
+    Format many energy amounts in one call.
+    
+    Args:
+        kwh (array-like): Energy amounts in kWh (list, ndarray or Series)
+        unit (str): Unit to display
+    
+    Returns:
+        list: Formatted energy strings
+    """
+    fmt = ("{:,.1f} " + unit.replace("{", "{{").replace("}", "}}")).format
+    return [fmt(value) for value in np.asarray(kwh).tolist()]
+
 def calculate_carbon_footprint(kwh, emission_factor=0.92):
     """
     Calculate CO2 emissions from energy consumption.
     
+    Works on a single value or on a whole column at once.
+    
     Args:
-        kwh (float): Energy consumption in kWh
+        kwh (float or array-like): Energy consumption in kWh
         emission_factor (float): lbs CO2 per kWh (default US average)
     
     Returns:
-        float: CO2 emissions in pounds
+        float or np.ndarray: CO2 emissions in pounds
     """
-    return kwh * emission_factor
+    if np.isscalar(kwh):
+        return kwh * emission_factor
+    return np.asarray(kwh, dtype=np.float64) * emission_factor
+
+# Efficiency levels from best to worst; a consumption/baseline ratio up to and
+# including EFFICIENCY_THRESHOLDS[i] earns EFFICIENCY_LEVELS[i]
+EFFICIENCY_THRESHOLDS = (0.7, 0.85, 1.0, 1.2)
+EFFICIENCY_LEVELS = (
+    {'rating': 'Excellent', 'score': 95, 'color': '#28a745'},
+    {'rating': 'Good', 'score': 85, 'color': '#20c997'},
+    {'rating': 'Average', 'score': 75, 'color': '#ffc107'},
+    {'rating': 'Below Average', 'score': 60, 'color': '#fd7e14'},
+    {'rating': 'Poor', 'score': 40, 'color': '#dc3545'}
+)
+EFFICIENCY_TABLE = pd.DataFrame(list(EFFICIENCY_LEVELS))
 
 def get_efficiency_rating(consumption, baseline):
     """
@@ -69,16 +119,29 @@ def get_efficiency_rating(consumption, baseline):
     """
     ratio = consumption / baseline if baseline > 0 else 1
     
-    if ratio <= 0.7:
-        return {'rating': 'Excellent', 'score': 95, 'color': '#28a745'}
-    elif ratio <= 0.85:
-        return {'rating': 'Good', 'score': 85, 'color': '#20c997'}
-    elif ratio <= 1.0:
-        return {'rating': 'Average', 'score': 75, 'color': '#ffc107'}
-    elif ratio <= 1.2:
-        return {'rating': 'Below Average', 'score': 60, 'color': '#fd7e14'}
-    else:
-        return {'rating': 'Poor', 'score': 40, 'color': '#dc3545'}
+    # Binary search over the thresholds instead of an if/elif chain
+    # (searchsorted sorts NaN last, so a NaN ratio is rated Poor as before)
+    level = int(np.searchsorted(EFFICIENCY_THRESHOLDS, ratio, side='left'))
+    return dict(EFFICIENCY_LEVELS[level])
+
+def get_efficiency_ratings(consumption, baseline):
+    """
+    Vectorized get_efficiency_rating for many readings at once.
+    
+    Args:
+        consumption (array-like): Current consumption values
+        baseline (array-like or float): Baseline values (broadcast against consumption)
+    
+    Returns:
+        pd.DataFrame: One row per reading with rating, score and color columns
+    """
+    consumption, baseline = np.broadcast_arrays(
+        np.asarray(consumption, dtype=np.float64),
+        np.asarray(baseline, dtype=np.float64)
+    )
+    ratio = np.divide(consumption, baseline, out=np.ones_like(consumption), where=baseline > 0)
+    levels = np.searchsorted(EFFICIENCY_THRESHOLDS, ratio, side='left')
+    return EFFICIENCY_TABLE.take(levels).reset_index(drop=True)
 
 def calculate_savings_potential(current_usage, efficient_usage_target=0.8):
     """
@@ -119,6 +182,12 @@ def get_peak_hours():
         ]
     }
 
+# Peak flag for each hour of the day (0-23), built once from get_peak_hours()
+IS_PEAK_HOUR = np.zeros(24, dtype=bool)
+_peak_hours = get_peak_hours()
+for _peak in (_peak_hours['morning_peak'], _peak_hours['evening_peak']):
+    IS_PEAK_HOUR[_peak['start']:_peak['end'] + 1] = True
+
 def calculate_time_of_use_savings(hourly_data, peak_rate=0.18, off_peak_rate=0.08):
     """
     Calculate potential savings with time-of-use electricity rates.
@@ -131,37 +200,54 @@ def calculate_time_of_use_savings(hourly_data, peak_rate=0.18, off_peak_rate=0.0
     Returns:
         dict: Time-of-use analysis
     """
-    peak_hours = get_peak_hours()
-    
-    # Categorize hours
-    hourly_data = hourly_data.copy()
-    hourly_data['rate_category'] = 'off_peak'
-    
-    # Mark peak hours
-    morning_peak = range(peak_hours['morning_peak']['start'], peak_hours['morning_peak']['end'] + 1)
-    evening_peak = range(peak_hours['evening_peak']['start'], peak_hours['evening_peak']['end'] + 1)
-    
-    hourly_data.loc[hourly_data['hour'].isin(morning_peak), 'rate_category'] = 'peak'
-    hourly_data.loc[hourly_data['hour'].isin(evening_peak), 'rate_category'] = 'peak'
-    
-    # Calculate costs
-    hourly_data['flat_rate_cost'] = hourly_data['consumption'] * 0.12  # Standard rate
-    hourly_data['tou_cost'] = hourly_data.apply(
-        lambda row: row['consumption'] * (peak_rate if row['rate_category'] == 'peak' else off_peak_rate),
-        axis=1
+    return time_of_use_analysis(
+        hourly_data['hour'].to_numpy(),
+        hourly_data['consumption'].to_numpy(),
+        peak_rate,
+        off_peak_rate
     )
+
+def time_of_use_analysis(hours, consumption, peak_rate=0.18, off_peak_rate=0.08):
+    """
+    Array version of calculate_time_of_use_savings.
+    
+    Args:
+        hours (np.ndarray): Hour of day (0-23) for each reading
+        consumption (np.ndarray): Consumption in kWh for each reading
+        peak_rate (float): Peak hour rate per kWh
+        off_peak_rate (float): Off-peak rate per kWh
     
-    flat_rate_total = hourly_data['flat_rate_cost'].sum()
-    tou_total = hourly_data['tou_cost'].sum()
+    Returns:
+        dict: Time-of-use analysis
+    """
+    # Mark peak hours with one table lookup over the whole column. Only whole
+    # hours in 0-23 are looked up; anything else (out of range, fractional,
+    # NaN) counts as off-peak, as the old isin() check treated it
+    hours = np.asarray(hours)
+    valid = (hours >= 0) & (hours < 24)
+    if not np.issubdtype(hours.dtype, np.integer):
+        valid &= hours == np.floor(hours)
+    peak_mask = np.zeros(hours.shape, dtype=bool)
+    peak_mask[valid] = IS_PEAK_HOUR[hours[valid].astype(np.intp)]
+    
+    # Calculate costs, vectorized instead of a per-row apply
+    consumption = np.asarray(consumption, dtype=np.float64)
+    # Missing readings count as zero, like pandas' NaN-skipping sums
+    consumption = np.where(np.isnan(consumption), 0.0, consumption)
+    total_usage = consumption.sum()
+    flat_rate_total = total_usage * 0.12  # Standard rate
+    tou_total = (consumption * np.where(peak_mask, peak_rate, off_peak_rate)).sum()
     savings = flat_rate_total - tou_total
     
+    peak_usage = consumption[peak_mask].sum()
+    
     return {
         'flat_rate_cost': flat_rate_total,
         'tou_cost': tou_total,
         'savings': savings,
         'savings_percentage': (savings / flat_rate_total) * 100 if flat_rate_total > 0 else 0,
-        'peak_usage': hourly_data[hourly_data['rate_category'] == 'peak']['consumption'].sum(),
-        'off_peak_usage': hourly_data[hourly_data['rate_category'] == 'off_peak']['consumption'].sum()
+        'peak_usage': peak_usage,
+        'off_peak_usage': total_usage - peak_usage
     }
 
 def generate_usage_summary(energy_data):
@@ -174,15 +260,40 @@ def generate_usage_summary(energy_data):
     Returns:
         dict: Usage summary statistics
     """
-    total_consumption = energy_data['consumption'].sum()
-    avg_daily = energy_data['consumption'].mean()
-    peak_day = energy_data.loc[energy_data['consumption'].idxmax()]
-    low_day = energy_data.loc[energy_data['consumption'].idxmin()]
+    # .array keeps dates as pandas Timestamps when indexed
+    return usage_summary(energy_data['consumption'].to_numpy(), energy_data['date'].array)
+
+def usage_summary(consumption, dates):
+    """
+    Array version of generate_usage_summary.
+    
+    Args:
+        consumption (np.ndarray): Daily consumption values in date order
+        dates (array-like): Date of each value
+    
+    Returns:
+        dict: Usage summary statistics
+    """
+    if NUMBA_AVAILABLE:
+        # Every statistic from one compiled pass over the column
+        (total_consumption, avg_daily, std_dev, peak_pos, low_pos,
+         older_avg, recent_avg) = summary_kernel(consumption)
+    else:
+        # NaN-skipping NumPy reductions, matching pandas; nanargmax raises
+        # ValueError first when there are no values, like the kernel
+        peak_pos = np.nanargmax(consumption)
+        low_pos = np.nanargmin(consumption)
+        total_consumption = np.nansum(consumption)
+        avg_daily = np.nanmean(consumption)
+        std_dev = np.nanstd(consumption, ddof=1)
+        recent_avg = np.nanmean(consumption[-7:])
+        older_avg = np.nanmean(consumption[:7])
+    
+    # Peak and low days are read by position straight from the arrays
+    peak_pos, low_pos = int(peak_pos), int(low_pos)
     
     # Calculate trends
-    if len(energy_data) >= 7:
-        recent_avg = energy_data['consumption'].tail(7).mean()
-        older_avg = energy_data['consumption'].head(7).mean()
+    if len(consumption) >= 7:
         trend = 'increasing' if recent_avg > older_avg else 'decreasing'
         trend_percentage = abs((recent_avg - older_avg) / older_avg) * 100
     else:
@@ -190,19 +301,18 @@ def generate_usage_summary(energy_data):
         trend_percentage = 0
     
     # Variability
-    std_dev = energy_data['consumption'].std()
     variability = 'high' if std_dev > avg_daily * 0.3 else 'low'
     
     return {
         'total_consumption': total_consumption,
         'average_daily': avg_daily,
         'peak_day': {
-            'date': peak_day['date'],
-            'consumption': peak_day['consumption']
+            'date': dates[peak_pos],
+            'consumption': consumption[peak_pos]
         },
         'low_day': {
-            'date': low_day['date'], 
-            'consumption': low_day['consumption']
+            'date': dates[low_pos], 
+            'consumption': consumption[low_pos]
         },
         'trend': trend,
         'trend_percentage': trend_percentage,
@@ -221,8 +331,9 @@ def load_config(config_file='config.json'):
         dict: Configuration dictionary
     """
     try:
-        with open(config_file, 'r') as f:
-            return json.load(f)
+        # The parsed file is cached until its modification time or size changes
+        stat = os.stat(config_file)
+        config = _read_config(config_file, stat.st_mtime_ns, stat.st_size)
     except FileNotFoundError:
         # Return default configuration
         return {
@@ -245,6 +356,15 @@ def load_config(config_file='config.json'):
                 'Wind + Grid'
             ]
         }
+    
+    # Hand out a copy so callers can't change the cached dict
+    return copy.deepcopy(config)
+
+@lru_cache(maxsize=8)
+def _read_config(config_file, mtime_ns, size):
+    """Parse a config file; mtime_ns and size only key the cache"""
+    with open(config_file, 'r') as f:
+        return json.load(f)
 
 def save_config(config_data, config_file='config.json'):
     """
@@ -256,6 +376,7 @@ def save_config(config_data, config_file='config.json'):
     """
     with open(config_file, 'w') as f:
         json.dump(config_data, f, indent=2)
+    _read_config.cache_clear()
 
 def validate_data(data, required_columns):
     """
@@ -284,16 +405,24 @@ def clean_energy_data(data):
     Returns:
         pd.DataFrame: Cleaned energy data
     """
-    data = data.copy()
-    
-    # Remove negative values
-    data = data[data['consumption'] >= 0]
+    consumption = data['consumption'].to_numpy()
     
-    # Remove extreme outliers (more than 5 standard deviations)
-    mean_consumption = data['consumption'].mean()
-    std_consumption = data['consumption'].std()
-    upper_limit = mean_consumption + (5 * std_consumption)
-    data = data[data['consumption'] <= upper_limit]
+    if NUMBA_AVAILABLE:
+        # Negative values and extreme outliers flagged in one compiled kernel
+        mask = clean_mask(consumption)
+    else:
+        # Remove negative values (NaN compares False, so it is dropped too)
+        valid = consumption >= 0
+        kept = consumption[valid]
+        
+        # Remove extreme outliers (more than 5 standard deviations)
+        mean_consumption = kept.mean() if kept.size > 0 else np.nan
+        std_consumption = kept.std(ddof=1) if kept.size > 1 else np.nan
+        upper_limit = mean_consumption + (5 * std_consumption)
+        mask = valid & (consumption <= upper_limit)
+    
+    # One combined mask, so only one filtered frame is built (and no up-front copy)
+    data = data[mask]
     
     # Sort by date
     if 'date' in data.columns:
@@ -312,10 +441,10 @@ def interpolate_missing_data(data, method='linear'):
     Returns:
         pd.DataFrame: Data with interpolated values
     """
-    data = data.copy()
-    
     if 'consumption' in data.columns:
-        data['consumption'] = data['consumption'].interpolate(method=method)
+        # assign returns a new frame with the replaced column; under pandas
+        # Copy-on-Write the untouched columns are shared instead of copied
+        data = data.assign(consumption=data['consumption'].interpolate(method=method))
     
     return data
 
@@ -330,8 +459,28 @@ def get_comparison_metrics(current_data, baseline_data):
     Returns:
         dict: Comparison metrics
     """
-    current_avg = current_data['consumption'].mean()
-    baseline_avg = baseline_data['consumption'].mean()
+    return comparison_metrics(
+        current_data['consumption'].to_numpy(),
+        baseline_data['consumption'].to_numpy()
+    )
+
+def comparison_metrics(current, baseline):
+    """
+    Array version of get_comparison_metrics.
+    
+    Args:
+        current (np.ndarray): Current period consumption values
+        baseline (np.ndarray): Baseline period consumption values
+    
+    Returns:
+        dict: Comparison metrics
+    """
+    if NUMBA_AVAILABLE:
+        current_avg = mean_kernel(current)
+        baseline_avg = mean_kernel(baseline)
+    else:
+        current_avg = np.nanmean(current)
+        baseline_avg = np.nanmean(baseline)
     
     difference = current_avg - baseline_avg
     percentage_change = (difference / baseline_avg) * 100 if baseline_avg > 0 else 0